@@ -27,6 +27,11 @@ from modules.dpi_utils import scale_font, scale_size
 from modules.notifications import create_notify_widget
 from modules.svg_utils import create_themed_icon_cache, get_svg_utils
 
+# OpenBSD apm(8) output scan; negative phrases come first so "no battery"
+# is matched whole rather than as a bare "battery"
+_APM_BATTERY_RE = re.compile(r"no battery|not present|battery", re.IGNORECASE)
+_APM_NO_BATTERY = frozenset({"no battery", "not present"})
+
 
 # Workaround for qtile-extras decoration wrapper bug
 # The inject_decorations wrapper tries to access widget.length before initialization
@@ -104,6 +109,9 @@ class EnhancedBarManager:
         # System state cache for dynamic icons
         self._system_state_cache = {}
 
+        # Battery support is probed once and reused for every screen's bar
+        self._battery_support_cache: bool | None = None
+
         # Generate themed icon cache (may use fallback colors initially)
         self._update_themed_icon_cache()
 
@@ -504,7 +512,30 @@ class EnhancedBarManager:
         """
         @brief Check if battery widget is supported on current platform
         @return True if battery is supported
+
+        The result is cached for the lifetime of the manager, so building
+        bars for several screens doesn't repeat the sysfs scan or spawn
+        apm/acpiconf again.
+        """
+        if self._battery_support_cache is None:
+            self._battery_support_cache = self._detect_battery_support()
+        return self._battery_support_cache
+
+    def _detect_battery_support(self) -> bool:
         """
+        @brief Probe the current platform for battery widget support
+        @return True if battery is supported
+        """
+        # Let containers/VMs/CI skip probing entirely with QTILE_BATTERY_DETECTED
+        override = os.environ.get("QTILE_BATTERY_DETECTED")
+        if override in ("0", "1"):
+            logger.debug(f"Battery support set by QTILE_BATTERY_DETECTED={override}")
+            return override == "1"
+        if override is not None:
+            logger.warning(
+                f"Ignoring QTILE_BATTERY_DETECTED={override!r}, expected 0 or 1"
+            )
+
         try:
             system = platform.system().lower()
             logger.debug(f"Checking battery support for platform: {system}")
@@ -531,26 +562,23 @@ class EnhancedBarManager:
         @brief Check for battery on Linux systems
         @return True if battery detected
         """
-        # Battery detection paths for different Unix-like systems
-        battery_paths = [
-            "/sys/class/power_supply/BAT0",  # Linux standard
-            "/sys/class/power_supply/BAT1",  # Linux secondary battery
-            "/sys/class/power_supply/battery",  # Linux generic
-            "/dev/acpi/battery",  # FreeBSD
-            "/dev/apm",  # OpenBSD APM
-        ]
+        # Enumerate power supplies instead of guessing names like BAT0/BAT1;
+        # one directory read plus one open per supply, no stat calls
+        try:
+            with os.scandir("/sys/class/power_supply") as entries:
+                supply_paths = [entry.path for entry in entries]
+        except OSError:
+            return False
 
-        for path in battery_paths:
-            if Path(path).exists():
-                type_file = Path(path) / "type"
-                if type_file.exists():
-                    try:
-                        battery_type = type_file.read_text().strip().lower()
-                        if battery_type == "battery":
-                            # Test actual widget compatibility
-                            return self._test_battery_widget_compatibility()
-                    except Exception:
-                        continue
+        for supply_path in supply_paths:
+            try:
+                with open(os.path.join(supply_path, "type")) as type_file:
+                    battery_type = type_file.read().strip().lower()
+            except OSError:
+                continue
+            if battery_type == "battery":
+                # Test actual widget compatibility
+                return self._test_battery_widget_compatibility()
         return False
 
     def _check_bsd_battery(self, system: str) -> bool:
@@ -573,13 +601,13 @@ class EnhancedBarManager:
                     logger.debug("apm command failed, no battery detected")
                     return False
 
-                output_lower = result.stdout.lower()
-                has_battery = "battery" in output_lower
-
-                # Additional checks for OpenBSD - apm might show "no battery" or similar
-                if "no battery" in output_lower or "not present" in output_lower:
+                # Single scan collecting both the battery mention and the
+                # "no battery"/"not present" indicators apm might show
+                matches = {m.lower() for m in _APM_BATTERY_RE.findall(result.stdout)}
+                if matches & _APM_NO_BATTERY:
                     logger.debug("apm output indicates no battery present")
                     return False
+                has_battery = bool(matches)
 
                 logger.debug(f"OpenBSD battery detection result: {has_battery}")
 
@@ -8,98 +8,98 @@ using doxygen. It creates a Doxyfile configuration, removes old docs, and
 generates fresh documentation.
 """
 
+import argparse
+import logging
 import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
-
-class DoxygenDocGenerator:
-    """
-    @brief Generates doxygen documentation for the qtile configuration project
-    """
-
-    def __init__(self):
-        """
-        @brief Initialize the documentation generator
-        """
-        self.project_root = Path(__file__).parent.parent.resolve()
-        self.docs_dir = self.project_root / "docs"
-        self.html_dir = self.docs_dir / "html"
-        self.doxyfile_path = self.project_root / "Doxyfile"
-
-        # Project information
-        self.project_name = "Qtile Configuration"
-        self.project_version = "1.0.0"
-        self.project_brief = (
-            "Modular qtile configuration with DPI awareness and color management"
-        )
-
-    def check_dependencies(self) -> bool:
-        """
-        @brief Check if doxygen and doxypypy are available on the system
-        @return True if both tools are installed and accessible, False otherwise
-        """
-        # Check doxygen
-        try:
-            result = subprocess.run(
-                ["doxygen", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                print(f"✓ Doxygen found: {result.stdout.strip()}")
-            else:
-                return False
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            print("✗ Doxygen is not installed or not accessible")
-            print("  Please install doxygen: sudo apt install doxygen (Debian/Ubuntu)")
-            print("  Or: sudo pkg install doxygen (FreeBSD/OpenBSD)")
-            return False
-
-        # Check doxypypy
-        try:
-            result = subprocess.run(
-                ["doxypypy", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                print(f"✓ Doxypypy found: {result.stdout.strip()}")
-                return True
-            else:
-                # Try alternative check
-                result = subprocess.run(
-                    ["doxypypy", "--help"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-                if result.returncode == 0:
-                    print("✓ Doxypypy found (help available)")
-                    return True
-                return False
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            print("✗ Doxypypy is not installed or not accessible")
-            print("  Please install doxypypy: pip install doxypypy")
-            print("  Or: sudo apt install doxypypy (if available)")
-            return False
-
-    def create_python_filter(self) -> bool:
-        """
-        @brief Create a Python filter script for doxygen
-        @return True if filter was created successfully, False otherwise
-        """
-        filter_script = '''#!/usr/bin/env python3
+logger = logging.getLogger("docgen")
+
+
+# Files doxygen documents; also drives the up-to-date check in run()
+_INPUT_FILES = (
+    "modules/bars.py",
+    "modules/client_hooks.py",
+    "modules/color_management.py",
+    "modules/colors.py",
+    "modules/commands.py",
+    "modules/config_validator.py",
+    "modules/dependency_container.py",
+    "modules/dpi_utils.py",
+    "modules/font_utils.py",
+    "modules/groups.py",
+    "modules/hook_manager.py",
+    "modules/hooks.py",
+    "modules/hotkey_system.py",
+    "modules/hotkeys.py",
+    "modules/key_bindings.py",
+    "modules/key_manager.py",
+    "modules/keys.py",
+    "modules/lifecycle_hooks.py",
+    "modules/notifications.py",
+    "modules/platform.py",
+    "modules/screens.py",
+    "modules/svg_utils.py",
+    "modules/window_manager.py",
+    "scripts/generate_docs.py",
+    "qtile_config.py",
+    "config.py",
+)
+
+# Doxyfile options that add parsing and per-symbol HTML output; all YES for
+# a full build and switched to NO by --fast for quick iteration
+_HEAVY_OPTIONS = (
+    "extract_private",
+    "extract_package",
+    "extract_static",
+    "extract_local_classes",
+    "extract_local_methods",
+    "extract_anon_nspaces",
+    "source_browser",
+    "references_link_source",
+    "source_tooltips",
+    "verbatim_headers",
+    "searchengine",
+    "search_includes",
+)
+
+# Embedded doxygen input filter, written out as python_filter.py and used by
+# FILTER_PATTERNS in the Doxyfile
+_FILTER_TEMPLATE = '''#!/usr/bin/env python3
 """
 Python filter for doxygen to convert Python docstrings to doxygen format
+
+Doxygen runs this as "python_filter.py <file>". The file is converted by
+doxypypy, and the output is cached by content hash so unchanged files skip
+doxypypy on later runs; only the newest entry per file is kept. Without a
+file argument, stdin is converted with the built-in converter instead.
 """
 import sys
-import re
 import ast
+import hashlib
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+# Bump when the filtering below changes so stale cache entries are ignored
+FILTER_VERSION = "3"
+# Resolved the same way the dependency check finds it, so a pip --user
+# install in ~/.local/bin works too
+DOXYPYPY_CMD = [shutil.which("doxypypy") or "doxypypy", "-a", "-c"]
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "qtile-dotfiles-docs"
+)
+
+BRIEF_TAG = '@brief'
+COMMENT_PREFIX = '//! '
+BRIEF_PREFIX = COMMENT_PREFIX + BRIEF_TAG + ' '
 
 def convert_docstring_to_doxygen(docstring):
     """Convert Python docstring to doxygen format"""
@@ -107,23 +107,20 @@ def convert_docstring_to_doxygen(docstring):
         return ""
 
     lines = docstring.strip().split('\\n')
-    result = []
 
     # Handle different docstring formats
-    if lines[0].strip().startswith('@brief'):
+    if lines[0].strip().startswith(BRIEF_TAG):
         # Already in doxygen format
-        return '\\n'.join(['//! ' + line for line in lines])
-
-    # Convert to doxygen format
-    result.append('//! @brief ' + lines[0])
-
-    for line in lines[1:]:
-        line = line.strip()
-        if line.startswith('@'):
-            result.append('//! ' + line)
-        elif line:
-            result.append('//! ' + line)
-
+        return '\\n'.join([COMMENT_PREFIX + line for line in lines])
+
+    # Convert to doxygen format: first line is the brief, remaining
+    # non-blank lines (tags or prose alike) are copied through
+    result = [BRIEF_PREFIX + lines[0]]
+    result.extend(
+        COMMENT_PREFIX + stripped
+        for stripped in (line.strip() for line in lines[1:])
+        if stripped
+    )
     return '\\n'.join(result)
 
 def process_python_file(content):
@@ -134,56 +131,98 @@ def process_python_file(content):
         return content
 
     lines = content.split('\\n')
-    result = []
 
+    # Collect all insertions in one walk, then apply them bottom-up so
+    # earlier insertions never shift the line numbers of later ones
+    insertions = []
     for node in ast.walk(tree):
         if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.AsyncFunctionDef)):
             if node.body and isinstance(node.body[0], ast.Expr) and isinstance(node.body[0].value, ast.Constant):
                 docstring = node.body[0].value.value
                 if isinstance(docstring, str):
-                    # Convert docstring
-                    doxy_comment = convert_docstring_to_doxygen(docstring)
-                    # Find the line number and insert comment
-                    for i, line in enumerate(lines):
-                        if i >= node.lineno - 1 and 'def ' in line or 'class ' in line:
-                            lines.insert(i, doxy_comment)
-                            break
+                    # Decorators belong to the definition, so the comment
+                    # goes above the first one rather than above the def
+                    if node.decorator_list:
+                        lineno = node.decorator_list[0].lineno
+                    else:
+                        lineno = node.lineno
+                    insertions.append(
+                        (lineno, convert_docstring_to_doxygen(docstring))
+                    )
+
+    insertions.sort(key=lambda item: item[0], reverse=True)
+    for lineno, doxy_comment in insertions:
+        lines.insert(lineno - 1, doxy_comment)
 
     return '\\n'.join(lines)
 
+def doxypypy_stamp():
+    """Identify the installed doxypypy; reinstalling it rewrites its launcher"""
+    try:
+        st = os.stat(DOXYPYPY_CMD[0])
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def doxypypy_cached(path):
+    """Run doxypypy on path, reusing output cached by content hash across runs"""
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    # doxypypy derives namespaces from the path, so each path gets its own
+    # directory; the entry inside is keyed by everything else the output
+    # depends on
+    entry_dir = CACHE_DIR / hashlib.sha256(os.fsencode(path)).hexdigest()
+    key = repr((FILTER_VERSION, DOXYPYPY_CMD, doxypypy_stamp())).encode() + content
+    digest = hashlib.sha256(key).hexdigest()
+    cache_file = entry_dir / digest
+    try:
+        return cache_file.read_bytes()
+    except OSError:
+        pass
+
+    try:
+        result = subprocess.run([*DOXYPYPY_CMD, path], capture_output=True)
+    except OSError as e:
+        sys.stderr.write(f"python_filter.py: cannot run {DOXYPYPY_CMD[0]}: {e}\\n")
+        return content
+    sys.stderr.buffer.write(result.stderr)
+    if result.returncode != 0:
+        # Pass failures through uncached so the next run retries them
+        return result.stdout
+
+    try:
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        # Whatever this path cached before is stale now, so drop it rather
+        # than letting edits and upgrades pile up
+        for stale in entry_dir.iterdir():
+            stale.unlink(missing_ok=True)
+        tmp_file = entry_dir / f"{digest}.{os.getpid()}.tmp"
+        tmp_file.write_bytes(result.stdout)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+    return result.stdout
+
 if __name__ == '__main__':
-    content = sys.stdin.read()
-    processed = process_python_file(content)
-    print(processed)
+    if len(sys.argv) > 1:
+        sys.stdout.buffer.write(doxypypy_cached(sys.argv[1]))
+    else:
+        print(process_python_file(sys.stdin.read()))
 '''
 
-        filter_path = self.project_root / "python_filter.py"
-        try:
-            with open(filter_path, "w") as f:
-                f.write(filter_script)
-            filter_path.chmod(0o755)
-            print(f"✓ Created Python filter at {filter_path}")
-            return True
-        except OSError as e:
-            print(f"✗ Failed to create Python filter: {e}")
-            return False
-
-    def create_doxyfile(self) -> bool:
-        """
-        @brief Create a Doxyfile configuration for the project optimized for Python
-        @return True if Doxyfile was created successfully, False otherwise
-        """
-        try:
-            doxyfile_content = f"""# Doxyfile for Qtile Configuration Documentation - Python Optimized
+# Doxyfile template; {name}, {version}, {brief} and {inputs} are filled in
+# per run, as are the _HEAVY_OPTIONS toggles
+_DOXYFILE_TEMPLATE = """# Doxyfile for Qtile Configuration Documentation - Python Optimized
 # Generated automatically by generate_docs.py
 
 #---------------------------------------------------------------------------
 # Project related configuration options
 #---------------------------------------------------------------------------
 DOXYFILE_ENCODING      = UTF-8
-PROJECT_NAME           = "{self.project_name}"
-PROJECT_NUMBER         = {self.project_version}
-PROJECT_BRIEF          = "{self.project_brief}"
+PROJECT_NAME           = "{name}"
+PROJECT_NUMBER         = {version}
+PROJECT_BRIEF          = "{brief}"
 PROJECT_LOGO           =
 OUTPUT_DIRECTORY       = docs
 CREATE_SUBDIRS         = NO
@@ -199,12 +238,12 @@ FULL_PATH_NAMES        = NO
 # Build related configuration options - Python Optimized
 #---------------------------------------------------------------------------
 EXTRACT_ALL            = YES
-EXTRACT_PRIVATE        = YES
-EXTRACT_PACKAGE        = YES
-EXTRACT_STATIC         = YES
-EXTRACT_LOCAL_CLASSES  = YES
-EXTRACT_LOCAL_METHODS  = YES
-EXTRACT_ANON_NSPACES   = YES
+EXTRACT_PRIVATE        = {extract_private}
+EXTRACT_PACKAGE        = {extract_package}
+EXTRACT_STATIC         = {extract_static}
+EXTRACT_LOCAL_CLASSES  = {extract_local_classes}
+EXTRACT_LOCAL_METHODS  = {extract_local_methods}
+EXTRACT_ANON_NSPACES   = {extract_anon_nspaces}
 HIDE_UNDOC_MEMBERS     = NO
 HIDE_UNDOC_CLASSES     = NO
 HIDE_FRIEND_COMPOUNDS  = NO
@@ -232,6 +271,7 @@ MAX_INITIALIZER_LINES  = 30
 SHOW_USED_FILES        = YES
 SHOW_FILES             = YES
 SHOW_NAMESPACES        = YES
+NUM_PROC_THREADS       = 0
 
 #---------------------------------------------------------------------------
 # Configuration options related to warning and progress messages
@@ -248,32 +288,7 @@ WARN_LOGFILE           =
 #---------------------------------------------------------------------------
 # Configuration options related to the input files - Python Optimized
 #---------------------------------------------------------------------------
-INPUT                  = modules/bars.py \\
-                         modules/client_hooks.py \\
-                         modules/color_management.py \\
-                         modules/colors.py \\
-                         modules/commands.py \\
-                         modules/config_validator.py \\
-                         modules/dependency_container.py \\
-                         modules/dpi_utils.py \\
-                         modules/font_utils.py \\
-                         modules/groups.py \\
-                         modules/hook_manager.py \\
-                         modules/hooks.py \\
-                         modules/hotkey_system.py \\
-                         modules/hotkeys.py \\
-                         modules/key_bindings.py \\
-                         modules/key_manager.py \\
-                         modules/keys.py \\
-                         modules/lifecycle_hooks.py \\
-                         modules/notifications.py \\
-                         modules/platform.py \\
-                         modules/screens.py \\
-                         modules/svg_utils.py \\
-                         modules/window_manager.py \\
-                         scripts/generate_docs.py \\
-                         qtile_config.py \\
-                         config.py
+INPUT                  = {inputs}
 INPUT_ENCODING         = UTF-8
 FILE_PATTERNS          = *.py \\
                          *.md
@@ -298,7 +313,7 @@ EXAMPLE_RECURSIVE      = YES
 IMAGE_PATH             = icons
 
 # Python-specific filters
-FILTER_PATTERNS        = "*.py=/bin/doxypypy -a -c"
+FILTER_PATTERNS        = "*.py=./python_filter.py"
 INPUT_FILTER           =
 FILTER_SOURCE_FILES    = YES
 FILTER_SOURCE_PATTERNS = *.py
@@ -320,15 +335,15 @@ USE_MDFILE_AS_MAINPAGE = README.md
 #---------------------------------------------------------------------------
 # Configuration options related to source browsing
 #---------------------------------------------------------------------------
-SOURCE_BROWSER         = YES
+SOURCE_BROWSER         = {source_browser}
 INLINE_SOURCES         = NO
 STRIP_CODE_COMMENTS    = YES
 REFERENCED_BY_RELATION = NO
 REFERENCES_RELATION    = NO
-REFERENCES_LINK_SOURCE = YES
-SOURCE_TOOLTIPS        = YES
+REFERENCES_LINK_SOURCE = {references_link_source}
+SOURCE_TOOLTIPS        = {source_tooltips}
 USE_HTAGS              = NO
-VERBATIM_HEADERS       = YES
+VERBATIM_HEADERS       = {verbatim_headers}
 CLANG_ASSISTED_PARSING = NO
 CLANG_OPTIONS          =
 
@@ -368,7 +383,7 @@ EXT_LINKS_IN_WINDOW    = NO
 FORMULA_FONTSIZE       = 10
 FORMULA_TRANSPARENT    = YES
 USE_MATHJAX            = NO
-SEARCHENGINE           = YES
+SEARCHENGINE           = {searchengine}
 SERVER_BASED_SEARCH    = NO
 EXTERNAL_SEARCH        = NO
 SEARCHDATA_FILE        = searchdata.xml
@@ -416,7 +431,7 @@ GENERATE_PERLMOD       = NO
 ENABLE_PREPROCESSING   = YES
 MACRO_EXPANSION        = NO
 EXPAND_ONLY_PREDEF     = NO
-SEARCH_INCLUDES        = YES
+SEARCH_INCLUDES        = {search_includes}
 INCLUDE_PATH           =
 INCLUDE_FILE_PATTERNS  =
 PREDEFINED             =
@@ -469,38 +484,253 @@ PLANTUML_INCLUDE_PATH  =
 DOT_GRAPH_MAX_NODES    = 50
 MAX_DOT_GRAPH_DEPTH    = 0
 DOT_TRANSPARENT        = NO
-DOT_MULTI_TARGETS      = NO
+DOT_MULTI_TARGETS      = YES
 GENERATE_LEGEND        = YES
 DOT_CLEANUP            = YES
 """
 
-            with open(self.doxyfile_path, "w") as f:
-                f.write(doxyfile_content)
+# docs/index.html redirect to the generated HTML
+_INDEX_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Qtile Configuration Documentation</title>
+    <meta http-equiv="refresh" content="0; url=html/index.html">
+    <style>
+        body { font-family: Arial, sans-serif; text-align: center; padding: 50px; }
+        .message { color: #666; margin-top: 20px; }
+    </style>
+</head>
+<body>
+    <h1>Qtile Configuration Documentation</h1>
+    <p>If you are not redirected automatically, <a href="html/index.html">click here</a>.</p>
+    <div class="message">
+        <p>Generated with Doxygen from Python docstrings</p>
+    </div>
+</body>
+</html>
+"""
+
+
+def _write_atomic(path: Path, content: str, mode: int | None = None) -> None:
+    """
+    @brief Write a file through a temporary sibling and an atomic rename
+    @param path: Destination file
+    @param content: Text to write
+    @param mode: Optional permission bits to apply before the rename
 
-            print(f"✓ Created Doxyfile at {self.doxyfile_path}")
+    Readers (doxygen, or a concurrent run) only ever see the old file or
+    the complete new one, never a partially written file.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        tmp_path.write_text(content)
+        if mode is not None:
+            tmp_path.chmod(mode)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _fast_rmtree(path: Path) -> None:
+    """
+    @brief Remove a directory tree, unlinking files from a thread pool
+    @param path: Directory to remove
+
+    Generated HTML output is thousands of small files; unlink is syscall
+    bound, so overlapping the calls is considerably faster than
+    shutil.rmtree's serial walk. Directories are removed bottom-up once
+    their contents are gone.
+    """
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for root, dirs, files in os.walk(path, topdown=False):
+            # os.walk lists symlinks to directories under dirs; unlink those
+            names = files + [d for d in dirs if os.path.islink(os.path.join(root, d))]
+            list(executor.map(os.unlink, [os.path.join(root, n) for n in names]))
+            os.rmdir(root)
+
+
+class DoxygenDocGenerator:
+    """
+    @brief Generates doxygen documentation for the qtile configuration project
+    """
+
+    def __init__(self, verbose: bool = False, force: bool = False, fast: bool = False):
+        """
+        @brief Initialize the documentation generator
+        @param verbose: Query and report tool versions during dependency checks
+        @param force: Rebuild even if no input file changed since the last build
+        @param fast: Disable source browsing, private members and search
+        """
+        self.verbose = verbose
+        self.force = force
+        self.fast = fast
+        self.build_profile = "fast" if fast else "full"
+        self.project_root = Path(__file__).parent.parent.resolve()
+        self.docs_dir = self.project_root / "docs"
+        self.html_dir = self.docs_dir / "html"
+        self.doxyfile_path = self.project_root / "Doxyfile"
+        self.build_stamp_path = self.docs_dir / ".last-build-mtime"
+
+        # Project information
+        self.project_name = "Qtile Configuration"
+        self.project_version = "1.0.0"
+        self.project_brief = (
+            "Modular qtile configuration with DPI awareness and color management"
+        )
+
+    def _check_doxygen(self) -> tuple[bool, list[str]]:
+        """
+        @brief Check if doxygen is available on the system
+        @return Tuple of (found, messages to report)
+        """
+        missing = [
+            "✗ Doxygen is not installed or not accessible",
+            "  Please install doxygen: sudo apt install doxygen (Debian/Ubuntu)",
+            "  Or: sudo pkg install doxygen (FreeBSD/OpenBSD)",
+        ]
+
+        # A PATH lookup is enough to know the tool exists; only spawn it
+        # when the version is actually going to be reported
+        doxygen = shutil.which("doxygen")
+        if doxygen is None:
+            return False, missing
+        if not self.verbose:
+            return True, [f"✓ Doxygen found: {doxygen}"]
+
+        try:
+            result = subprocess.run(
+                [doxygen, "--version"],
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+            if result.returncode == 0:
+                return True, [f"✓ Doxygen found: {result.stdout.strip()}"]
+            return False, []
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return False, missing
+
+    def _check_doxypypy(self) -> tuple[bool, list[str]]:
+        """
+        @brief Check if doxypypy is available on the system
+        @return Tuple of (found, messages to report)
+        """
+        missing = [
+            "✗ Doxypypy is not installed or not accessible",
+            "  Please install doxypypy: pip install doxypypy",
+            "  Or: sudo apt install doxypypy (if available)",
+        ]
+
+        doxypypy = shutil.which("doxypypy")
+        if doxypypy is None:
+            return False, missing
+        if not self.verbose:
+            return True, [f"✓ Doxypypy found: {doxypypy}"]
+
+        try:
+            result = subprocess.run(
+                [doxypypy, "--version"],
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+            if result.returncode == 0:
+                return True, [f"✓ Doxypypy found: {result.stdout.strip()}"]
+
+            # Try alternative check
+            result = subprocess.run(
+                [doxypypy, "--help"],
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+            if result.returncode == 0:
+                return True, ["✓ Doxypypy found (help available)"]
+            return False, []
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return False, missing
+
+    def check_dependencies(self) -> bool:
+        """
+        @brief Check if doxygen and doxypypy are available on the system
+        @return True if both tools are installed and accessible, False otherwise
+
+        By default both probes are PATH lookups and run inline. With
+        --verbose each one spawns its tool for the version, so they run
+        concurrently; messages are reported afterwards in a fixed order.
+        """
+        probes = [self._check_doxygen, self._check_doxypypy]
+        if self.verbose:
+            with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+                futures = [executor.submit(probe) for probe in probes]
+                results = [future.result() for future in futures]
+        else:
+            results = [probe() for probe in probes]
+
+        for _, messages in results:
+            for message in messages:
+                logger.info(message)
+
+        return all(found for found, _ in results)
+
+    def create_python_filter(self) -> bool:
+        """
+        @brief Create a Python filter script for doxygen
+        @return True if filter was created successfully, False otherwise
+        """
+        filter_path = self.project_root / "python_filter.py"
+        try:
+            _write_atomic(filter_path, _FILTER_TEMPLATE, mode=0o755)
+            logger.info(f"✓ Created Python filter at {filter_path}")
+            return True
+        except OSError as e:
+            logger.error(f"✗ Failed to create Python filter: {e}")
+            return False
+
+    def create_doxyfile(self) -> bool:
+        """
+        @brief Create a Doxyfile configuration for the project optimized for Python
+        @return True if Doxyfile was created successfully, False otherwise
+        """
+        try:
+            _write_atomic(
+                self.doxyfile_path,
+                _DOXYFILE_TEMPLATE.format(
+                    name=self.project_name,
+                    version=self.project_version,
+                    brief=self.project_brief,
+                    inputs=" \\\n                         ".join(_INPUT_FILES),
+                    **dict.fromkeys(_HEAVY_OPTIONS, "NO" if self.fast else "YES"),
+                ),
+            )
+
+            logger.info(f"✓ Created Doxyfile at {self.doxyfile_path}")
             return True
 
         except OSError as e:
-            print(f"✗ Failed to create Doxyfile: {e}")
+            logger.error(f"✗ Failed to create Doxyfile: {e}")
             return False
 
     def remove_old_docs(self) -> None:
         """
         @brief Remove old documentation files from the docs directory
         """
-        print("Removing old documentation...")
+        logger.info("Removing old documentation...")
 
         # Remove old markdown docs but keep the directory structure
         if self.docs_dir.exists():
             for item in self.docs_dir.iterdir():
                 if item.is_file() and item.suffix == ".md":
                     item.unlink()
-                    print(f"  Removed: {item.name}")
+                    logger.info(f"  Removed: {item.name}")
                 elif item.is_dir() and item.name == "html":
-                    shutil.rmtree(item)
-                    print(f"  Removed: {item.name}/ (directory)")
+                    _fast_rmtree(item)
+                    logger.info(f"  Removed: {item.name}/ (directory)")
 
-        print("✓ Old documentation cleaned up")
+        logger.info("✓ Old documentation cleaned up")
 
     def generate_docs(self) -> bool:
         """
@@ -508,82 +738,42 @@ DOT_CLEANUP            = YES
         @return True if documentation was generated successfully, False otherwise
         @throws subprocess.SubprocessError if doxygen execution fails
         """
-        # Store original directory before any operations
-        original_cwd = os.getcwd()
-
         try:
-            print("Generating doxygen documentation...")
-
-            # Ensure we're in the project root directory for doxygen execution
-            print(f"Current directory: {original_cwd}")
-            print(f"Changing to project root: {self.project_root}")
-            os.chdir(self.project_root)
-
-            # Verify we're in the right directory
-            current_dir = os.getcwd()
-            print(f"Working directory for doxygen: {current_dir}")
+            logger.info("Generating doxygen documentation...")
+            logger.info(f"Working directory for doxygen: {self.project_root}")
 
-            # Run doxygen
+            # Run doxygen from the project root (the Doxyfile uses relative
+            # paths) with our stdout/stderr so its progress is shown as it
+            # happens rather than buffered until it exits
+            sys.stdout.flush()
             result = subprocess.run(
-                ["doxygen", "Doxyfile"],
-                capture_output=True,
-                text=True,
-                timeout=120,
+                ["doxygen", "Doxyfile"], cwd=self.project_root, timeout=120
             )
 
             if result.returncode == 0:
-                print("✓ Doxygen documentation generated successfully")
-                if result.stdout:
-                    print(f"Doxygen output: {result.stdout}")
+                logger.info("✓ Doxygen documentation generated successfully")
                 return True
             else:
-                print(f"✗ Doxygen failed with return code {result.returncode}")
-                if result.stderr:
-                    print(f"Error output: {result.stderr}")
+                logger.error(f"✗ Doxygen failed with return code {result.returncode}")
                 return False
 
         except subprocess.TimeoutExpired:
-            print("✗ Doxygen execution timed out")
+            logger.error("✗ Doxygen execution timed out")
             return False
         except Exception as e:
-            print(f"✗ Error running doxygen: {e}")
+            logger.error(f"✗ Error running doxygen: {e}")
             return False
-        finally:
-            # Always restore original working directory
-            os.chdir(original_cwd)
 
     def create_index_redirect(self) -> None:
         """
         @brief Create an index.html redirect to the main documentation
         """
-        index_content = """<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <title>Qtile Configuration Documentation</title>
-    <meta http-equiv="refresh" content="0; url=html/index.html">
-    <style>
-        body { font-family: Arial, sans-serif; text-align: center; padding: 50px; }
-        .message { color: #666; margin-top: 20px; }
-    </style>
-</head>
-<body>
-    <h1>Qtile Configuration Documentation</h1>
-    <p>If you are not redirected automatically, <a href="html/index.html">click here</a>.</p>
-    <div class="message">
-        <p>Generated with Doxygen from Python docstrings</p>
-    </div>
-</body>
-</html>
-"""
-
         index_path = self.docs_dir / "index.html"
         try:
-            with open(index_path, "w") as f:
-                f.write(index_content)
-            print(f"✓ Created index redirect at {index_path}")
+            index_path.write_text(_INDEX_TEMPLATE)
+            logger.info(f"✓ Created index redirect at {index_path}")
         except OSError as e:
-            print(f"✗ Failed to create index redirect: {e}")
+            logger.error(f"✗ Failed to create index redirect: {e}")
 
     def cleanup_doxyfile(self) -> None:
         """
@@ -591,68 +781,122 @@ DOT_CLEANUP            = YES
         """
         if self.doxyfile_path.exists():
             self.doxyfile_path.unlink()
-            print("✓ Cleaned up temporary Doxyfile")
+            logger.info("✓ Cleaned up temporary Doxyfile")
 
         filter_path = self.project_root / "python_filter.py"
         if filter_path.exists():
             filter_path.unlink()
-            print("✓ Cleaned up Python filter")
+            logger.info("✓ Cleaned up Python filter")
 
     def print_summary(self):
         """
         @brief Print a summary of the generated documentation
         """
-        print("\n" + "=" * 60)
-        print("📚 DOCUMENTATION GENERATION COMPLETE")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("📚 DOCUMENTATION GENERATION COMPLETE")
+        logger.info("=" * 60)
 
         if self.html_dir.exists():
-            html_files = list(self.html_dir.glob("*.html"))
-            print(f"✓ Generated {len(html_files)} HTML files")
-            print(f"✓ Documentation location: {self.html_dir}")
-            print(f"✓ Main page: {self.docs_dir}/index.html")
-            print("\n💡 To view the documentation:")
-            print(f"   Open: file://{self.docs_dir.absolute()}/index.html")
-            print("   Or use: python -m http.server 8000 (in docs directory)")
+            html_count = sum(1 for _ in self.html_dir.glob("*.html"))
+            logger.info(f"✓ Generated {html_count} HTML files")
+            logger.info(f"✓ Documentation location: {self.html_dir}")
+            logger.info(f"✓ Main page: {self.docs_dir}/index.html")
+            logger.info("\n💡 To view the documentation:")
+            # docs_dir derives from the resolved project root, so it is
+            # already absolute
+            logger.info(f"   Open: file://{self.docs_dir}/index.html")
+            logger.info("   Or use: python -m http.server 8000 (in docs directory)")
         else:
-            print("✗ HTML documentation directory not found")
+            logger.error("✗ HTML documentation directory not found")
+
+    def _newest_input_mtime(self) -> float:
+        """
+        @brief Get the most recent modification time of the doxygen inputs
+        @return Newest st_mtime among existing input files (0.0 if none)
+        """
+        newest = 0.0
+        for name in _INPUT_FILES:
+            try:
+                newest = max(newest, (self.project_root / name).stat().st_mtime)
+            except OSError:
+                continue
+        return newest
+
+    def _docs_up_to_date(self, newest: float) -> bool:
+        """
+        @brief Check whether the last build already covers the current inputs
+        @param newest: Newest input modification time
+        @return True if HTML docs exist, were built with the same profile and
+                no input changed since
+        """
+        if not self.html_dir.exists():
+            return False
+        try:
+            stamp = self.build_stamp_path.read_text().split()
+            built = float(stamp[0])
+        except (OSError, ValueError, IndexError):
+            return False
+        # Stamps from before profiles were recorded are full builds
+        profile = stamp[1] if len(stamp) > 1 else "full"
+        return profile == self.build_profile and newest <= built
 
     def run(self) -> bool:
         """
         @brief Run the complete documentation generation process
         @return True if all steps completed successfully, False otherwise
         """
-        print("🔧 Starting Doxygen Documentation Generation")
-        print(f"Project: {self.project_name}")
-        print(f"Root: {self.project_root}")
-        print("-" * 50)
+        logger.info("🔧 Starting Doxygen Documentation Generation")
+        logger.info(f"Project: {self.project_name}")
+        logger.info(f"Root: {self.project_root}")
+        logger.info("-" * 50)
 
         # Check if dependencies are available
         if not self.check_dependencies():
             return False
 
+        # Skip the whole pipeline if nothing changed since the last build
+        newest_input = self._newest_input_mtime()
+        if not self.force and self._docs_up_to_date(newest_input):
+            logger.info("✓ Documentation is up to date (use --force to rebuild)")
+            return True
+
         # Create docs directory if it doesn't exist
         self.docs_dir.mkdir(exist_ok=True)
 
-        # Debug: List files that should be processed
-        print("\n🔍 DEBUG: Files that should be processed:")
-        for pattern in [
-            "modules/*.py",
-            "modules/**/*.py",
-            "scripts/*.py",
-            "*.py",
-        ]:
-            import glob
-
-            files = glob.glob(pattern, recursive=True)
-            for f in files[:5]:  # Show first 5
-                print(f"  Found: {f}")
-        print()
-
-        # Execute generation steps
-        steps = [
+        # Debug: List files that should be processed (set DOCGEN_DEBUG=1)
+        if os.environ.get("DOCGEN_DEBUG"):
+            logger.info("\n🔍 DEBUG: Files that should be processed:")
+            for pattern in [
+                "modules/*.py",
+                "modules/**/*.py",
+                "scripts/*.py",
+                "*.py",
+            ]:
+                # Path.glob is lazy, so the walk stops after the first 5 hits
+                for f in islice(self.project_root.glob(pattern), 5):
+                    logger.info(f"  Found: {f.relative_to(self.project_root)}")
+            logger.info("")
+
+        # The filter and Doxyfile touch disjoint files, so write them
+        # concurrently; the old docs are only removed once both succeeded
+        preparation_steps = [
             ("Creating Python filter", self.create_python_filter),
             ("Creating Doxyfile", self.create_doxyfile),
+        ]
+
+        logger.info(f"\n{', '.join(name for name, _ in preparation_steps)}...")
+        with ThreadPoolExecutor(max_workers=len(preparation_steps)) as executor:
+            futures = [
+                (step_name, executor.submit(step_func))
+                for step_name, step_func in preparation_steps
+            ]
+        for step_name, future in futures:
+            if not future.result():
+                logger.error(f"✗ Failed at: {step_name}")
+                return False
+
+        # Execute the remaining generation steps in order
+        steps = [
             ("Removing old docs", lambda: (self.remove_old_docs(), True)[1]),
             ("Generating documentation", self.generate_docs),
             (
@@ -663,11 +907,16 @@ DOT_CLEANUP            = YES
         ]
 
         for step_name, step_func in steps:
-            print(f"\n{step_name}...")
+            logger.info(f"\n{step_name}...")
             if not step_func():
-                print(f"✗ Failed at: {step_name}")
+                logger.error(f"✗ Failed at: {step_name}")
                 return False
 
+        try:
+            self.build_stamp_path.write_text(f"{newest_input} {self.build_profile}\n")
+        except OSError as e:
+            logger.warning(f"⚠ Could not record build time: {e}")
+
         self.print_summary()
         return True
 
@@ -677,7 +926,34 @@ def main() -> int:
     @brief Main function to run the documentation generator
     @return Exit code (0 for success, 1 for failure)
     """
-    generator = DoxygenDocGenerator()
+    parser = argparse.ArgumentParser(
+        description="Generate doxygen documentation for the qtile configuration"
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Query and report doxygen/doxypypy versions",
+    )
+    parser.add_argument(
+        "--force",
+        "-f",
+        action="store_true",
+        help="Regenerate even if no input file changed since the last build",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Quick build without source browser, private members or search",
+    )
+    args = parser.parse_args()
+
+    # Bare messages on stdout, interleaving cleanly with doxygen's own output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
+    generator = DoxygenDocGenerator(
+        verbose=args.verbose, force=args.force, fast=args.fast
+    )
     success = generator.run()
     return 0 if success else 1
 
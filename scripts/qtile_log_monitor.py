@@ -28,12 +28,29 @@ Examples:
     python3 scripts/qtile_log_monitor.py --lines 100
 """
 
-import argparse
+# argparse, shutil and watchdog are imported where they're used; together
+# they cost more than the rest of a cache-hit startup
+import json
 import os
+import shlex
+import stat
 import subprocess
 import sys
+import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, BinaryIO
+
+# Probe results are cached between runs so startup doesn't fork qtile every time
+PROBE_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "qtile_log_monitor"
+    / "probe.json"
+)
+QTILE_CMD_TTL = 30
+LOG_PATH_TTL = 5
+READ_CHUNK_SIZE = 65536
 
 
 class QtileLogMonitor:
@@ -44,76 +61,142 @@ class QtileLogMonitor:
     log files in real-time with various filtering and display options.
     """
 
-    def __init__(self) -> None:
-        """@brief Initialize qtile log monitor"""
-        self.log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        self.qtile_cmd = self._find_qtile_command()
-        self.log_path = self._find_log_path()
+    def __init__(self, refresh_cache: bool = False) -> None:
+        """
+        @brief Initialize qtile log monitor
+        @param refresh_cache: Ignore cached probe results and probe again
+        """
+        # Tuple keeps display order; the frozenset is for membership checks
+        self.log_levels = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+        self._log_levels_set = frozenset(self.log_levels)
+        self.refresh_cache = refresh_cache
+        self._probe_cache = self._load_probe_cache()
+        # Counted for this run only so a cache hit never has to write to disk
+        self._probe_stats = {"hits": 0, "misses": 0}
+        self.qtile_cmd = self._cached(
+            "qtile_argv", QTILE_CMD_TTL, self._find_qtile_command
+        )
+        log_path = self._cached(
+            "log_path", LOG_PATH_TTL, lambda: str(self._find_log_path() or "")
+        )
+        self.log_path = Path(log_path) if log_path else None
+        if self._probe_stats["misses"]:
+            self._save_probe_cache()
+
+    def _load_probe_cache(self) -> dict[str, Any]:
+        """
+        @brief Load cached probe results from disk
+        @return Cache dictionary, empty if missing or unreadable
+        """
+        try:
+            with open(PROBE_CACHE_FILE, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_probe_cache(self) -> None:
+        """@brief Atomically write probe results back to disk"""
+        tmp_path = PROBE_CACHE_FILE.with_name(f".{PROBE_CACHE_FILE.name}.{os.getpid()}")
+        try:
+            PROBE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(self._probe_cache), encoding="utf-8")
+            os.replace(tmp_path, PROBE_CACHE_FILE)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
 
-    def _find_qtile_command(self) -> str:
+    def _cached(self, key: str, ttl: float, fn: Callable[[], Any]) -> Any:
+        """
+        @brief Return a cached probe result, running the probe when stale
+        @param key: Cache entry name
+        @param ttl: Maximum age of a cached entry in seconds
+        @param fn: Probe to run on a cache miss
+        @return Cached or freshly probed value
+        """
+        entry = self._probe_cache.get(key)
+        if (
+            not self.refresh_cache
+            and isinstance(entry, dict)
+            and time.time() - entry.get("ts", 0) < ttl
+        ):
+            self._probe_stats["hits"] += 1
+            return entry.get("val")
+
+        self._probe_stats["misses"] += 1
+        value = fn()
+        self._probe_cache[key] = {"ts": time.time(), "val": value}
+        return value
+
+    def _find_qtile_command(self) -> list[str]:
         """
         @brief Find qtile command executable
-        @return Path to qtile command or 'qtile' as fallback
+        @return Argument list with a resolved executable, or ['qtile'] as fallback
         """
+        import shutil
+
         # Try common qtile command locations
-        possible_commands = ["qtile", "qtile-cmd", "python3 -m qtile"]
+        possible_commands = (["qtile"], ["qtile-cmd"], [sys.executable, "-m", "qtile"])
 
         for cmd in possible_commands:
-            try:
-                # Test if command exists and works
-                result = subprocess.run(
-                    f"{cmd} --help",
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-                if result.returncode == 0:
-                    print(f"✅ Found qtile command: {cmd}")
-                    return cmd
-            except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+            # Skip the probe entirely when the executable isn't on PATH
+            exe = shutil.which(cmd[0])
+            if not exe:
                 continue
+            # Test if command works; keep the resolved path so later calls run
+            # the same binary that was probed
+            resolved = [exe, *cmd[1:]]
+            if self._run_quietly([*resolved, "--help"], timeout=10) == 0:
+                print(f"✅ Found qtile command: {shlex.join(resolved)}")
+                return resolved
 
         print("⚠️  Could not verify qtile command - using 'qtile' as fallback")
-        return "qtile"
+        return ["qtile"]
+
+    @staticmethod
+    def _run_quietly(argv: list[str], timeout: float) -> int | None:
+        """
+        @brief Run a command with its output discarded and return its status
+        @param argv: Argument list to run
+        @param timeout: Seconds to wait before killing the command
+        @return Exit status, or None if it could not run or timed out
+        """
+        try:
+            return subprocess.run(
+                argv,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=timeout,
+            ).returncode
+        except (subprocess.SubprocessError, OSError):
+            return None
 
     def _find_log_path(self) -> Path | None:
         """
         @brief Find qtile log file location
         @return Path to qtile log file or None if not found
         """
+        home = str(Path.home())
         # Common qtile log locations
-        possible_paths = [
+        possible_paths = (
             # XDG standard locations
-            Path.home() / ".cache" / "qtile" / "qtile.log",
-            Path.home() / ".local" / "share" / "qtile" / "qtile.log",
+            f"{home}/.cache/qtile/qtile.log",
+            f"{home}/.local/share/qtile/qtile.log",
             # Legacy/alternative locations
-            Path.home() / ".qtile" / "qtile.log",
-            Path("/tmp") / f"qtile-{os.getuid()}" / "qtile.log",
-            Path("/var/log") / "qtile" / "qtile.log",
+            f"{home}/.qtile/qtile.log",
+            f"/tmp/qtile-{os.getuid()}/qtile.log",
+            "/var/log/qtile/qtile.log",
             # Check if qtile is running and has a log
-            Path("/tmp") / "qtile.log",
-        ]
+            "/tmp/qtile.log",
+        )
 
-        # Try to get log path from qtile itself
-        try:
-            result = subprocess.run(
-                f"{self.qtile_cmd} cmd-obj -o core -f info",
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0 and "log" in result.stdout.lower():
-                print(f"📋 Qtile info: {result.stdout.strip()}")
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-            pass
-
-        # Check each possible path
+        # One stat per candidate; missing files are the common case
         for log_path in possible_paths:
-            if log_path.exists() and log_path.is_file():
-                print(f"📄 Found qtile log: {log_path}")
-                return log_path
+            try:
+                if stat.S_ISREG(os.stat(log_path).st_mode):
+                    print(f"📄 Found qtile log: {log_path}")
+                    return Path(log_path)
+            except OSError:
+                continue
 
         print("❌ Could not find qtile log file")
         print("💡 Possible locations checked:")
@@ -128,7 +211,7 @@ class QtileLogMonitor:
         @return True if successful, False otherwise
         """
         level = level.upper()
-        if level not in self.log_levels:
+        if level not in self._log_levels_set:
             print(f"❌ Invalid log level: {level}")
             print(f"Valid levels: {', '.join(self.log_levels)}")
             return False
@@ -147,21 +230,35 @@ class QtileLogMonitor:
             level_num = level_map[level]
 
             # Try different qtile CLI approaches to set log level
+            shell_cmd = [*self.qtile_cmd, "shell", "-c"]
+            set_level_args = ["-f", "set_log_level", "-a", level]
             commands_to_try = [
-                f"{self.qtile_cmd} shell -c \"import logging; logging.getLogger('libqtile').setLevel({level_num}); print('Set libqtile logger to', {level_num})\"",
-                f"{self.qtile_cmd} shell -c \"import logging; logging.getLogger('qtile').setLevel({level_num}); print('Set qtile logger to', {level_num})\"",
-                f"{self.qtile_cmd} shell -c \"import logging; logging.getLogger().setLevel({level_num}); print('Set root logger to', {level_num})\"",
-                f"{self.qtile_cmd} shell -c \"from libqtile.log_utils import logger; logger.setLevel({level_num}); print('Set log_utils logger to', {level_num})\"",
-                f"{self.qtile_cmd} cmd-obj -o core -f set_log_level -a {level}",
-                f"{self.qtile_cmd} shell -c \"qtile.core.set_log_level('{level}')\"",
-                f"{self.qtile_cmd} cmd-obj -o cmd -f set_log_level -a {level}",
+                [
+                    *shell_cmd,
+                    f"import logging; logging.getLogger('libqtile').setLevel({level_num}); print('Set libqtile logger to', {level_num})",
+                ],
+                [
+                    *shell_cmd,
+                    f"import logging; logging.getLogger('qtile').setLevel({level_num}); print('Set qtile logger to', {level_num})",
+                ],
+                [
+                    *shell_cmd,
+                    f"import logging; logging.getLogger().setLevel({level_num}); print('Set root logger to', {level_num})",
+                ],
+                [
+                    *shell_cmd,
+                    f"from libqtile.log_utils import logger; logger.setLevel({level_num}); print('Set log_utils logger to', {level_num})",
+                ],
+                [*self.qtile_cmd, "cmd-obj", "-o", "core", *set_level_args],
+                [*shell_cmd, f"qtile.core.set_log_level('{level}')"],
+                [*self.qtile_cmd, "cmd-obj", "-o", "cmd", *set_level_args],
             ]
 
             for cmd in commands_to_try:
                 try:
-                    print(f"⚙️  Trying command: {cmd}")
+                    print(f"⚙️  Trying command: {shlex.join(cmd)}")
                     result = subprocess.run(
-                        cmd, shell=True, capture_output=True, text=True, timeout=10
+                        cmd, capture_output=True, text=True, timeout=10
                     )
 
                     print(f"📤 Return code: {result.returncode}")
@@ -177,7 +274,10 @@ class QtileLogMonitor:
                         print(f"⚠️  Command failed with return code {result.returncode}")
 
                 except subprocess.TimeoutExpired:
-                    print(f"⏰ Command timed out: {cmd}")
+                    print(f"⏰ Command timed out: {shlex.join(cmd)}")
+                    continue
+                except OSError as e:
+                    print(f"⚠️  Could not run {cmd[0]}: {e}")
                     continue
 
         except Exception as e:
@@ -210,10 +310,20 @@ class QtileLogMonitor:
                 # Just show last N lines
                 cmd = ["tail", "-n", str(lines), str(self.log_path)]
 
+            import shutil
+
             # Try to use system tail command first
+            tail_path = shutil.which("tail")
             try:
-                subprocess.run(cmd, check=True)
-            except (subprocess.SubprocessError, FileNotFoundError):
+                if tail_path is None:
+                    raise FileNotFoundError("tail")
+                if sys.platform != "win32":
+                    # Nothing left to do once tail runs, so let it replace
+                    # this interpreter instead of waiting on a child process
+                    sys.stdout.flush()
+                    os.execv(tail_path, cmd)
+                subprocess.run([tail_path, *cmd[1:]], check=True)
+            except (subprocess.SubprocessError, OSError):
                 # Fallback to Python implementation
                 print("📝 Using Python log monitoring (system 'tail' not available)")
                 self._python_tail(lines, follow)
@@ -231,52 +341,189 @@ class QtileLogMonitor:
             return
 
         try:
-            with open(self.log_path, encoding="utf-8", errors="ignore") as f:
-                # Read initial lines
-                all_lines = f.readlines()
-                if len(all_lines) > lines:
-                    initial_lines = all_lines[-lines:]
-                else:
-                    initial_lines = all_lines
-
+            with open(self.log_path, "rb") as f:
                 # Print initial lines
-                for line in initial_lines:
-                    print(line.rstrip())
+                initial_lines = self._read_last_lines(f, lines)
+                if initial_lines:
+                    self._write_stdout(b"\n".join(initial_lines) + b"\n")
 
                 if not follow:
                     return
 
                 # Follow the file for new content
                 f.seek(0, 2)  # Seek to end
-                while True:
-                    line = f.readline()
-                    if line:
-                        print(line.rstrip())
-                    else:
-                        time.sleep(0.1)
+                self._follow_with_watchdog(f)
 
         except Exception as e:
             print(f"❌ Error reading log file: {e}")
 
+    @staticmethod
+    def _read_last_lines(f: BinaryIO, lines: int) -> list[bytes]:
+        """
+        @brief Read the last lines of a file by scanning backwards in blocks
+        @param f: Log file opened in binary mode
+        @param lines: Number of lines to return
+        @return Up to `lines` trailing lines, without line endings
+
+        Only the tail of the file is read, so a large debug log doesn't get
+        loaded into memory just to show its last few lines.
+        """
+        if lines <= 0:
+            return []
+
+        pos = f.seek(0, 2)
+        buf = b""
+        while pos > 0:
+            block = min(8192, pos)
+            pos -= block
+            f.seek(pos)
+            buf = f.read(block) + buf
+            # One extra newline guarantees the first wanted line is complete
+            if buf.count(b"\n") > lines:
+                break
+        return buf.splitlines()[-lines:]
+
+    def _follow_with_watchdog(self, f: BinaryIO) -> None:
+        """
+        @brief Follow the log file, waking only when it is modified
+        @param f: Open log file positioned where output should resume
+
+        Blocks on a file-system event (inotify/kqueue via watchdog) instead
+        of polling, so an idle log costs no wakeups and new lines show up
+        as soon as qtile writes them. Falls back to polling when watchdog
+        isn't installed.
+        """
+        if not self.log_path:
+            self._follow_with_polling(f)
+            return
+
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            self._follow_with_polling(f)
+            return
+
+        changed = threading.Event()
+        rotated = threading.Event()
+        log_file = str(self.log_path)
+
+        class LogChangeHandler(FileSystemEventHandler):
+            def on_modified(self, event: Any) -> None:
+                if not event.is_directory and event.src_path == log_file:
+                    changed.set()
+
+            def on_created(self, event: Any) -> None:
+                if not event.is_directory and event.src_path == log_file:
+                    rotated.set()
+                    changed.set()
+
+            def on_moved(self, event: Any) -> None:
+                if not event.is_directory and log_file in (
+                    event.src_path,
+                    event.dest_path,
+                ):
+                    rotated.set()
+                    changed.set()
+
+        observer = Observer()
+        observer.schedule(
+            LogChangeHandler(), str(self.log_path.parent), recursive=False
+        )
+        observer.start()
+        # Read the descriptor directly from here on; f's buffer is empty
+        # after the seek to the end, so nothing is skipped
+        fd = f.fileno()
+        try:
+            while True:
+                # Clear before draining so a write racing the drain re-arms us
+                changed.clear()
+                self._drain_fd(fd)
+                if rotated.is_set():
+                    # Log was rotated: finish the old file, then switch to
+                    # the new one once it exists
+                    rotated.clear()
+                    try:
+                        new_fd = os.open(log_file, os.O_RDONLY | os.O_CLOEXEC)
+                    except FileNotFoundError:
+                        pass
+                    else:
+                        if fd != f.fileno():
+                            os.close(fd)
+                        fd = new_fd
+                        continue
+                changed.wait()
+        finally:
+            if fd != f.fileno():
+                os.close(fd)
+            observer.stop()
+            observer.join()
+
+    def _drain_fd(self, fd: int) -> None:
+        """
+        @brief Copy everything readable from a log descriptor to stdout
+        @param fd: Open log file descriptor
+
+        Starts over from the beginning if the file was truncated in place,
+        as copytruncate-style rotation does.
+        """
+        if os.fstat(fd).st_size < os.lseek(fd, 0, os.SEEK_CUR):
+            os.lseek(fd, 0, os.SEEK_SET)
+        while chunk := os.read(fd, READ_CHUNK_SIZE):
+            self._write_stdout(chunk)
+
+    def _follow_with_polling(self, f: BinaryIO) -> None:
+        """
+        @brief Follow the log file by polling for new lines
+        @param f: Open log file positioned where output should resume
+        """
+        while True:
+            chunk = f.read(READ_CHUNK_SIZE)
+            if chunk:
+                self._write_stdout(chunk)
+            else:
+                time.sleep(0.1)
+
+    @staticmethod
+    def _write_stdout(data: bytes) -> None:
+        """
+        @brief Write raw log bytes straight to the stdout file descriptor
+        @param data: Bytes to write, already newline terminated
+
+        Log content is passed through undecoded, and a whole batch of lines
+        goes out in one write() instead of one print() per line.
+        """
+        sys.stdout.flush()  # Keep earlier print() output ahead of the log
+        view = memoryview(data)
+        while view:
+            view = view[os.write(sys.stdout.fileno(), view) :]
+
     def show_log_info(self) -> None:
         """@brief Show information about qtile logging setup"""
         print("🔍 Qtile Log Monitor Information")
         print("=" * 50)
-        print(f"Qtile command: {self.qtile_cmd}")
+        print(f"Qtile command: {shlex.join(self.qtile_cmd)}")
         print(f"Log file: {self.log_path or 'Not found'}")
         print(f"Available log levels: {', '.join(self.log_levels)}")
+        print(
+            f"Probe cache: {self._probe_stats['hits']} hits, "
+            f"{self._probe_stats['misses']} misses ({PROBE_CACHE_FILE})"
+        )
         print()
 
-        if self.log_path and self.log_path.exists():
-            stat = self.log_path.stat()
-            print(f"Log file size: {stat.st_size} bytes")
-            print(f"Last modified: {time.ctime(stat.st_mtime)}")
+        if self.log_path:
+            try:
+                file_stat = os.stat(self.log_path)
+            except OSError:
+                pass
+            else:
+                print(f"Log file size: {file_stat.st_size} bytes")
+                print(f"Last modified: {time.ctime(file_stat.st_mtime)}")
 
         # Try to get current qtile status
         try:
             result = subprocess.run(
-                f"{self.qtile_cmd} cmd-obj -o core -f info",
-                shell=True,
+                [*self.qtile_cmd, "cmd-obj", "-o", "core", "-f", "info"],
                 capture_output=True,
                 text=True,
                 timeout=5,
@@ -284,12 +531,14 @@ class QtileLogMonitor:
             if result.returncode == 0:
                 print("🎯 Current qtile status:")
                 print(result.stdout.strip())
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+        except (subprocess.SubprocessError, OSError):
             print("⚠️  Could not get current qtile status")
 
 
 def main() -> None:
     """@brief Main entry point for qtile log monitor"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Monitor qtile logs with configurable log level",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -341,8 +590,8 @@ Examples:
 
     args = parser.parse_args()
 
-    # Create monitor instance
-    monitor = QtileLogMonitor()
+    # Create monitor instance; --info always re-probes instead of trusting the cache
+    monitor = QtileLogMonitor(refresh_cache=args.info)
 
     # Show info and exit if requested
     if args.info:
@@ -26,27 +26,33 @@ def main() -> None:
     dpi_manager = get_dpi_manager()
     info = dpi_manager.get_scaling_info()
 
-    print("🖥️  DPI Information for Qtile Configuration")
-    print("=" * 50)
-    print(f"Current DPI: {info['dpi']:.1f}")
-    print(f"Scale Factor: {info['scale_factor']:.2f}x")
-    print(f"Category: {info['category']}")
-    print()
-    print("📏 Scaled Sizes:")
-    print(f"  Bar Height: {info['bar_height']}px (base: 28px)")
-    print(f"  Icon Size: {info['icon_size']}px (base: 16px)")
-    print(f"  Margin: {info['margin']}px (base: 4px)")
-    print(f"  Font Size: {info['recommended_font_base']}px (base: 12px)")
-    print()
-    print("🔧 Manual overrides:")
-    print("  Set QT_SCALE_FACTOR environment variable")
-    print("  Add 'Xft.dpi: XXX' to ~/.Xresources")
-    print()
-    print("🧪 Test scaling:")
-    print(f"  scale_size(10) = {dpi_manager.scale(10)}px")
-    print(f"  scale_size(20) = {dpi_manager.scale(20)}px")
-    print(f"  scale_font(12) = {dpi_manager.scale_font(12)}px")
-    print(f"  scale_font(16) = {dpi_manager.scale_font(16)}px")
+    report = [
+        "🖥️  DPI Information for Qtile Configuration",
+        "=" * 50,
+        f"Current DPI: {info['dpi']:.1f}",
+        f"Scale Factor: {info['scale_factor']:.2f}x",
+        f"Category: {info['category']}",
+        "",
+        "📏 Scaled Sizes:",
+        f"  Bar Height: {info['bar_height']}px (base: 28px)",
+        f"  Icon Size: {info['icon_size']}px (base: 16px)",
+        f"  Margin: {info['margin']}px (base: 4px)",
+        f"  Font Size: {info['recommended_font_base']}px (base: 12px)",
+        "",
+        "🔧 Manual overrides:",
+        "  Set QT_SCALE_FACTOR environment variable",
+        "  Add 'Xft.dpi: XXX' to ~/.Xresources",
+        "",
+        "🧪 Test scaling:",
+        f"  scale_size(10) = {dpi_manager.scale(10)}px",
+        f"  scale_size(20) = {dpi_manager.scale(20)}px",
+        f"  scale_font(12) = {dpi_manager.scale_font(12)}px",
+        f"  scale_font(16) = {dpi_manager.scale_font(16)}px",
+    ]
+
+    # Emit the whole report in a single write rather than one print per line
+    sys.stdout.write("\n".join(report) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
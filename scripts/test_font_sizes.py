@@ -16,7 +16,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
     from qtile_config import get_config
-    from modules.dpi_utils import get_dpi_manager, scale_font
+    from modules.dpi_utils import get_dpi_manager
 except ImportError as e:
     print(f"❌ Error importing qtile modules: {e}")
     print("Make sure you're running this from the qtile config directory.")
@@ -43,29 +43,39 @@ def test_font_sizes():
         (18, 22, "Extra Large"),
     ]
     
-    print("🧪 Testing Font Size Combinations:")
-    print("-" * 60)
-    print("| Style       | Text Size | Icon Size | Scaled Text | Scaled Icon |")
-    print("|-------------|-----------|-----------|-------------|-------------|")
+    # Test different bar heights
+    bar_heights = [20, 24, 28, 32, 36, 40]
+
+    # Scale each distinct size once; the text, icon and bar height columns
+    # share most of their values
+    sizes = {size for text_size, icon_size, _ in test_sizes for size in (text_size, icon_size)}
+    scaled = {size: dpi_manager.scale_font(size) for size in sizes.union(bar_heights)}
+
+    # Build each table in full and write it in one go rather than a print per row
+    font_table = [
+        "🧪 Testing Font Size Combinations:",
+        "-" * 60,
+        "| Style       | Text Size | Icon Size | Scaled Text | Scaled Icon |",
+        "|-------------|-----------|-----------|-------------|-------------|",
+    ]
     
     for text_size, icon_size, label in test_sizes:
-        scaled_text = scale_font(text_size)
-        scaled_icon = scale_font(icon_size)
+        scaled_text = scaled[text_size]
+        scaled_icon = scaled[icon_size]
         
-        print(f"| {label:<11} | {text_size:>9} | {icon_size:>9} | {scaled_text:>11} | {scaled_icon:>11} |")
+        font_table.append(f"| {label:<11} | {text_size:>9} | {icon_size:>9} | {scaled_text:>11} | {scaled_icon:>11} |")
     
-    print()
+    sys.stdout.write("\n".join(font_table) + "\n\n")
     
-    # Test different bar heights
-    bar_heights = [20, 24, 28, 32, 36, 40]
-    
-    print("📏 Testing Bar Height Options:")
-    print("-" * 40)
-    print("| Height | Scaled | Description     |")
-    print("|--------|--------|-----------------|")
+    height_table = [
+        "📏 Testing Bar Height Options:",
+        "-" * 40,
+        "| Height | Scaled | Description     |",
+        "|--------|--------|-----------------|",
+    ]
     
     for height in bar_heights:
-        scaled_height = scale_font(height)  # Use scale_font for consistency
+        scaled_height = scaled[height]
         if height <= 24:
             desc = "Compact"
         elif height <= 28:
@@ -75,7 +85,9 @@ def test_font_sizes():
         else:
             desc = "Spacious"
         
-        print(f"| {height:>6} | {scaled_height:>6} | {desc:<15} |")
+        height_table.append(f"| {height:>6} | {scaled_height:>6} | {desc:<15} |")
+
+    sys.stdout.write("\n".join(height_table) + "\n")
     
     print()
     print("🎯 To Apply Changes:")
@@ -94,8 +106,8 @@ def test_font_sizes():
     current_bar_height = config.preferred_bar_height
     
     print("📄 Current Settings:")
-    print(f"   Text size: {current_text} → scaled: {scale_font(current_text)}")
-    print(f"   Icon size: {current_icon} → scaled: {scale_font(current_icon)}")
+    print(f"   Text size: {current_text} → scaled: {dpi_manager.scale_font(current_text)}")
+    print(f"   Icon size: {current_icon} → scaled: {dpi_manager.scale_font(current_icon)}")
     print(f"   Bar height: {current_bar_height} → scaled: {config.bar_settings['height']}")
     print()
     